@@ -0,0 +1,34 @@
+"""PDF text extraction run inside the ingest process pool.
+
+Kept out of streamlit_app.py because Streamlit re-executes that script as a
+fresh ``__main__`` module on every rerun, which breaks pickling tasks by
+reference while an ingest is still feeding the pool.
+"""
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+
+def extract_text_from_pdf(
+    file_path: Path, download_dir: Path
+) -> Optional[List[Tuple[str, int, str]]]:
+    """Extracts flat (file, page, text) rows in a worker process; None if parsing failed"""
+    file = str(file_path.relative_to(download_dir))
+    rows = []
+    try:
+        logger.info(f"Extracting text from {file_path}")
+        with fitz.open(file_path) as doc:
+            for i, page in enumerate(doc):
+                # Casefold once at ingest; queries are folded the same way
+                text = page.get_text().casefold()
+                # Scanned image pages yield only whitespace; keep them out of the index
+                if text.strip():
+                    rows.append((file, i + 1, text))
+    except Exception as e:
+        logger.error(f"Error extracting text from {file_path}: {e}")
+        return None
+    return rows
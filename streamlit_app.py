@@ -3,16 +3,28 @@ import re
 import shutil
 import os
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sqlite3
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from html.parser import HTMLParser
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse, unquote
 
 import requests
 import streamlit as st
-from bs4 import BeautifulSoup
-from pypdf import PdfReader
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from pdf_extract import extract_text_from_pdf
 
 # Load environment variables
 load_dotenv()
@@ -20,15 +32,41 @@ load_dotenv()
 # --- Configuration ---
 BASE_URL = os.getenv("BASE_URL", "https://www.justice.gov/epstein/court-records")
 DOWNLOAD_DIR = Path(os.getenv("DOWNLOAD_DIR", "downloads"))
-INDEX_FILE = Path(os.getenv("INDEX_FILE", "search_corpus.json"))
-MAX_WORKERS_DOWNLOADS = int(os.getenv("MAX_WORKERS_DOWNLOADS", "8"))
-MAX_WORKERS_PARSING = int(os.getenv("MAX_WORKERS_PARSING", "4"))
+INDEX_FILE = Path(os.getenv("INDEX_FILE", "corpus.db"))
+DOWNLOAD_MANIFEST = DOWNLOAD_DIR / "download_manifest.json"
+MAX_WORKERS_DOWNLOADS = int(os.getenv("MAX_WORKERS_DOWNLOADS", "32"))
+MAX_WORKERS_PARSING = min(int(os.getenv("MAX_WORKERS_PARSING", "4")), os.cpu_count() or 1)
+# Max files submitted to the parsing pool but not yet written to the index
+PARSING_WINDOW = MAX_WORKERS_PARSING * 8
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+MIN_TRIGRAM_TERM_LENGTH = 3
+INDEX_COMMIT_INTERVAL = 50
+OPTIMIZE_MIN_FRACTION = 0.25
+SQLITE_MMAP_SIZE = 1 << 30
+SQLITE_CACHE_SIZE = -200_000  # negative means KiB, i.e. ~200 MB
+SQLITE_HEADER = b"SQLite format 3\x00"
+MIN_SQLITE_VERSION = (3, 34, 0)  # first release with the FTS5 trigram tokenizer
+SQLITE_TOO_OLD = sqlite3.sqlite_version_info < MIN_SQLITE_VERSION
+SQLITE_VERSION_ERROR = (
+    f"SQLite {sqlite3.sqlite_version} is too old for the search index; "
+    f"{'.'.join(map(str, MIN_SQLITE_VERSION))}+ is required for the FTS5 trigram tokenizer."
+)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
 # Setup logging
 logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so download threads reuse pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=MAX_WORKERS_DOWNLOADS * 2,
+    pool_maxsize=MAX_WORKERS_DOWNLOADS * 2,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 # --- Mobile-Friendly CSS ---
 MOBILE_CSS = """
 <style>
@@ -125,6 +163,23 @@ MOBILE_CSS = """
 
 # --- Helper Functions (Robust Logic) ---
 
+def index_file_is_usable() -> bool:
+    """Checks INDEX_FILE is missing, empty or SQLite (not e.g. a legacy search_corpus.json)"""
+    if not INDEX_FILE.exists() or INDEX_FILE.stat().st_size == 0:
+        return True
+    try:
+        with open(INDEX_FILE, "rb") as f:
+            if f.read(len(SQLITE_HEADER)) == SQLITE_HEADER:
+                return True
+    except OSError as e:
+        logger.error(f"Error reading search index {INDEX_FILE}: {e}")
+        return False
+    logger.error(
+        f"INDEX_FILE={INDEX_FILE} is not an SQLite database (the JSON corpus format is no longer "
+        "supported). Set INDEX_FILE to a new path such as corpus.db and re-run ingest."
+    )
+    return False
+
 def initialize_session_state() -> None:
     """Initialize session state variables"""
     if "pdf_links" not in st.session_state:
@@ -132,7 +187,9 @@ def initialize_session_state() -> None:
     if "is_downloaded" not in st.session_state:
         st.session_state.is_downloaded = False
     if "corpus_built" not in st.session_state:
-        st.session_state.corpus_built = INDEX_FILE.exists()
+        st.session_state.corpus_built = (
+            not SQLITE_TOO_OLD and INDEX_FILE.exists() and index_file_is_usable()
+        )
     if "search_history" not in st.session_state:
         st.session_state.search_history = []
 
@@ -143,19 +200,34 @@ def validate_search_term(term: str) -> bool:
     # Add more validation as needed
     return True
 
+class AnchorHrefParser(HTMLParser):
+    """Collects the href of every <a> tag, skipping comments, scripts and other attributes"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.hrefs: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href is not None:
+                self.hrefs.append(href)
+
 def get_pdf_links_robust(url: str) -> List[str]:
-    """Scrapes links using BeautifulSoup with error handling"""
+    """Scrapes <a href> PDF links with the stdlib HTML parser and error handling"""
     try:
         logger.info(f"Fetching PDF links from {url}")
-        response = requests.get(url, timeout=20)
+        response = SESSION.get(url, timeout=20)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        parser = AnchorHrefParser()
+        parser.feed(response.text)
+        parser.close()
         links = set()
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href'].strip()
+        for href in parser.hrefs:
+            # HTMLParser has already unescaped entities in attribute values
+            href = href.strip()
             if href.lower().endswith('.pdf'):
-                full_url = urljoin(url, href)
-                links.add(full_url)
+                links.add(urljoin(url, href))
         logger.info(f"Found {len(links)} PDF links")
         return sorted(list(links))
     except requests.exceptions.RequestException as e:
@@ -163,8 +235,29 @@ def get_pdf_links_robust(url: str) -> List[str]:
         st.error(f"Error fetching links: {e}")
         return []
 
-def download_pdf_headless(url: str) -> Optional[Path]:
-    """Downloads files with improved error handling"""
+def load_download_manifest() -> Dict[str, Dict[str, any]]:
+    """Loads the url -> {size, etag} record of completed downloads"""
+    if not DOWNLOAD_MANIFEST.exists():
+        return {}
+    try:
+        with open(DOWNLOAD_MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading download manifest: {e}")
+        return {}
+
+def save_download_manifest(manifest: Dict[str, Dict[str, any]]) -> None:
+    """Atomically writes the download manifest next to the downloaded files"""
+    tmp_path = DOWNLOAD_MANIFEST.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        tmp_path.replace(DOWNLOAD_MANIFEST)
+    except OSError as e:
+        logger.error(f"Error saving download manifest: {e}")
+
+def download_pdf_headless(url: str, manifest: Dict[str, Dict[str, any]]) -> Optional[Path]:
+    """Downloads files with improved error handling, resuming partial downloads"""
     try:
         logger.info(f"Downloading {url}")
         parsed_url = urlparse(url)
@@ -177,16 +270,59 @@ def download_pdf_headless(url: str) -> Optional[Path]:
 
         local_path = DOWNLOAD_DIR / relative_path
         local_path.parent.mkdir(parents=True, exist_ok=True)
+        existing = local_path.stat().st_size if local_path.exists() else 0
 
-        if local_path.exists():
+        # Files recorded as complete in the manifest are skipped without touching the network
+        recorded = manifest.get(url)
+        if recorded and existing == recorded["size"]:
             logger.info(f"File already exists: {local_path}")
             return local_path
 
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        with open(local_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Ask for the raw bytes everywhere so on-disk sizes line up with Content-Length
+        headers = {"Accept-Encoding": "identity"}
+        try:
+            head = SESSION.head(url, headers=headers, allow_redirects=True, timeout=20)
+            head.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Some servers and CDNs reject HEAD; download in full without a size check
+            logger.warning(f"HEAD failed for {url}, downloading without size check: {e}")
+            head = None
+
+        etag = head.headers.get("ETag") if head is not None else None
+        content_length = head.headers.get("Content-Length") if head is not None else None
+        expected = int(content_length) if content_length else None
+
+        # Without a Content-Length an existing file can't be checked, so trust it
+        if existing and head is not None and (expected is None or existing == expected):
+            logger.info(f"File already exists: {local_path}")
+            manifest[url] = {"size": existing, "etag": etag}
+            return local_path
+
+        if (
+            existing
+            and expected is not None
+            and existing < expected
+            and head.headers.get("Accept-Ranges") == "bytes"
+        ):
+            logger.info(f"Resuming {url} from byte {existing}")
+            headers["Range"] = f"bytes={existing}-"
+            if etag:
+                # Server sends the full file instead if it changed since the partial download
+                headers["If-Range"] = etag
+
+        with SESSION.get(url, headers=headers, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            mode = "ab" if response.status_code == 206 else "wb"
+            # Decode any Content-Encoding the server applies anyway, then copy in 1 MiB blocks
+            response.raw.decode_content = True
+            with open(local_path, mode) as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
+
+        size = local_path.stat().st_size
+        if expected is not None and size != expected:
+            logger.warning(f"Incomplete download of {url}: {size}/{expected} bytes")
+            return None
+        manifest[url] = {"size": size, "etag": etag}
         logger.info(f"Successfully downloaded to {local_path}")
         return local_path
     except requests.exceptions.RequestException as e:
@@ -196,55 +332,210 @@ def download_pdf_headless(url: str) -> Optional[Path]:
         logger.error(f"Unexpected error downloading {url}: {e}")
         return None
 
-def extract_text_from_pdf(file_path: Path) -> Dict[str, any]:
-    """Extracts text for indexing with error handling"""
-    page_data = {}
+def ensure_index_schema(conn: sqlite3.Connection) -> None:
+    """Creates the FTS5 table and the per-file manifest used for incremental indexing"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(indexed_files)")}
+    if columns and "first_rowid" not in columns:
+        # Index predates rowid tracking, so its rows can't be deleted per file; start over
+        logger.info("Search corpus manifest has no rowid ranges; rebuilding the index")
+        conn.execute("DROP TABLE indexed_files")
+        conn.execute("DROP TABLE IF EXISTS docs")
+    conn.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5("
+        "file UNINDEXED, page UNINDEXED, content, tokenize='trigram')"
+    )
+    # Each file's pages occupy the rowid range [first_rowid, last_rowid] in docs, so they
+    # can be deleted by rowid instead of scanning the UNINDEXED file column
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS indexed_files ("
+        "file TEXT PRIMARY KEY, mtime REAL NOT NULL, size INTEGER NOT NULL, "
+        "first_rowid INTEGER NOT NULL, last_rowid INTEGER NOT NULL)"
+    )
+
+def load_index_manifest() -> Dict[str, Tuple[float, int, int, int]]:
+    """Returns the (mtime, size, first_rowid, last_rowid) recorded for each indexed file"""
+    conn = sqlite3.connect(INDEX_FILE)
     try:
-        logger.info(f"Extracting text from {file_path}")
-        reader = PdfReader(file_path)
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text()
-            if text:
-                page_data[i + 1] = text
-    except Exception as e:
-        logger.error(f"Error extracting text from {file_path}: {e}")
-    return {"file": str(file_path.relative_to(DOWNLOAD_DIR)), "content": page_data}
+        with conn:
+            ensure_index_schema(conn)
+        return {
+            file: tuple(entry)
+            for file, *entry in conn.execute(
+                "SELECT file, mtime, size, first_rowid, last_rowid FROM indexed_files"
+            )
+        }
+    finally:
+        conn.close()
+
+def delete_file_rows(conn: sqlite3.Connection, entries: List[Tuple[float, int, int, int]]) -> None:
+    """Deletes the docs rows of the given manifest entries by their rowid ranges"""
+    conn.executemany(
+        "DELETE FROM docs WHERE rowid BETWEEN ? AND ?",
+        [(first_rowid, last_rowid) for _, _, first_rowid, last_rowid in entries],
+    )
 
 def build_search_corpus(progress_bar, status_text) -> None:
-    """Builds the search index with parallel processing"""
+    """Incrementally updates the SQLite FTS5 search index with parallel processing"""
     files = list(DOWNLOAD_DIR.rglob("*.pdf"))
-    total_files = len(files)
-    corpus = {}
 
-    if total_files == 0:
+    if not files:
         status_text.text("No PDF files found to index.")
         return
 
-    logger.info(f"Building search corpus from {total_files} files")
+    if SQLITE_TOO_OLD:
+        logger.error(SQLITE_VERSION_ERROR)
+        status_text.text(SQLITE_VERSION_ERROR)
+        return
+
+    if not index_file_is_usable():
+        status_text.text(f"{INDEX_FILE} is not an SQLite index; set INDEX_FILE to e.g. corpus.db.")
+        return
+
+    try:
+        manifest = load_index_manifest()
+    except sqlite3.Error as e:
+        logger.error(f"Error reading search corpus manifest: {e}")
+        status_text.text("Error building search index.")
+        return
+
+    # Only new or modified files are parsed; removed files are dropped from the index
+    current: Dict[str, Tuple[float, int]] = {}
+    to_parse: List[Path] = []
+    for file_path in files:
+        stat = file_path.stat()
+        rel_path = str(file_path.relative_to(DOWNLOAD_DIR))
+        current[rel_path] = (stat.st_mtime, stat.st_size)
+        if rel_path not in manifest or manifest[rel_path][:2] != current[rel_path]:
+            to_parse.append(file_path)
+    removed = [file for file in manifest if file not in current]
+    total_files = len(to_parse)
+
+    if total_files == 0 and not removed:
+        st.session_state.corpus_built = True
+        status_text.text("Index is up to date.")
+        logger.info("Search corpus is up to date")
+        return
+
+    logger.info(
+        f"Updating search corpus: {total_files} new or changed files, {len(removed)} removed"
+    )
     status_text.text("Parsing PDFs for text...")
     
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS_PARSING) as executor:
-        future_to_file = {executor.submit(extract_text_from_pdf, f): f for f in files}
-        completed = 0
-        for future in as_completed(future_to_file):
-            result = future.result()
-            if result["content"]:
-                corpus[result["file"]] = result["content"]
-            completed += 1
-            progress_bar.progress(completed / total_files)
-
     try:
-        with open(INDEX_FILE, "w", encoding="utf-8") as f:
-            json.dump(corpus, f)
+        conn = sqlite3.connect(INDEX_FILE)
+        # Segment merges read the index through the mapping, not heap buffers
+        conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+        try:
+            delete_file_rows(conn, [manifest[f] for f in removed])
+            conn.executemany("DELETE FROM indexed_files WHERE file = ?", [(f,) for f in removed])
+            conn.commit()
+            last = conn.execute("SELECT rowid FROM docs ORDER BY rowid DESC LIMIT 1").fetchone()
+            next_rowid = (last[0] if last else 0) + 1
+
+            indexed = 0
+            # Parsing is CPU-bound, so use processes rather than threads to sidestep the GIL.
+            # Only PARSING_WINDOW files are in flight at once and each file's rows are written
+            # as soon as they arrive, together with its manifest entry, so memory stays bounded
+            # and an interrupted run resumes where it stopped.
+            with ProcessPoolExecutor(max_workers=MAX_WORKERS_PARSING) as executor:
+                pending = iter(to_parse)
+                in_flight: Dict[Future, Path] = {}
+                completed = 0
+                while True:
+                    for file_path in islice(pending, PARSING_WINDOW - len(in_flight)):
+                        future = executor.submit(extract_text_from_pdf, file_path, DOWNLOAD_DIR)
+                        in_flight[future] = file_path
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        rel_path = str(in_flight.pop(future).relative_to(DOWNLOAD_DIR))
+                        file_rows = future.result()
+                        completed += 1
+                        progress_bar.progress(completed / total_files)
+                        status_text.text(f"Indexing {completed}/{total_files}")
+                        if file_rows is None:
+                            # Leave failed files out of the manifest so the next run retries them
+                            continue
+                        if rel_path in manifest:
+                            delete_file_rows(conn, [manifest[rel_path]])
+                        first_rowid = next_rowid
+                        next_rowid += len(file_rows)
+                        conn.executemany(
+                            "INSERT INTO docs (rowid, file, page, content) VALUES (?, ?, ?, ?)",
+                            [(first_rowid + i, *row) for i, row in enumerate(file_rows)],
+                        )
+                        conn.execute(
+                            "INSERT OR REPLACE INTO indexed_files "
+                            "(file, mtime, size, first_rowid, last_rowid) VALUES (?, ?, ?, ?, ?)",
+                            (rel_path, *current[rel_path], first_rowid, next_rowid - 1),
+                        )
+                        indexed += 1
+                        if indexed % INDEX_COMMIT_INTERVAL == 0:
+                            conn.commit()
+
+            if indexed >= OPTIMIZE_MIN_FRACTION * len(current):
+                # Bulk loads (including resumed ones) leave many segments; merge into one b-tree.
+                # Small deltas are left to FTS5's automerge.
+                conn.execute("INSERT INTO docs (docs) VALUES ('optimize')")
+            conn.commit()
+        finally:
+            conn.close()
         st.session_state.corpus_built = True
         status_text.text("Index Built Successfully.")
         logger.info("Search corpus built successfully")
     except Exception as e:
+        # Also covers pool failures, e.g. BrokenProcessPool when MuPDF crashes a worker
         logger.error(f"Error saving search corpus: {e}")
         status_text.text("Error building search index.")
 
+def to_fts_phrase(term: str) -> str:
+    """Quotes a raw search term as an FTS5 phrase so operators are not interpreted"""
+    return '"' + term.replace('"', '""') + '"'
+
+def to_like_pattern(term: str) -> str:
+    """Escapes a raw search term for a substring LIKE pattern (ESCAPE '\\')"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+@st.cache_resource(max_entries=1)
+def get_corpus_connection(index_mtime: float) -> sqlite3.Connection:
+    """Opens the search index once and shares it across reruns; keyed on the index mtime"""
+    logger.info(f"Opening search corpus {INDEX_FILE} (mtime {index_mtime})")
+    # Read-write open, so a hot journal left by an interrupted ingest can be rolled back;
+    # query_only still keeps this shared connection from ever writing
+    conn = sqlite3.connect(INDEX_FILE, check_same_thread=False)
+    conn.execute("PRAGMA query_only = 1")
+    # Serve index pages straight from the OS page cache and keep hot pages in SQLite's cache
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = {SQLITE_CACHE_SIZE}")
+    return conn
+
+@st.cache_data(ttl=120, max_entries=256, show_spinner=False)
+def query_corpus(term: str, index_mtime: float) -> List[Dict[str, any]]:
+    """Runs a normalized query against the index; results are cached per (term, index mtime)"""
+    conn = get_corpus_connection(index_mtime)
+    if len(term) >= MIN_TRIGRAM_TERM_LENGTH:
+        # Substring match served by the trigram index, case-insensitively, in C
+        cursor = conn.execute(
+            "SELECT file, page FROM docs WHERE content MATCH ? ORDER BY file, page",
+            (to_fts_phrase(term),),
+        )
+    else:
+        # Trigrams cannot index terms this short; fall back to a LIKE scan
+        cursor = conn.execute(
+            "SELECT file, page FROM docs WHERE content LIKE ? ESCAPE '\\' ORDER BY file, page",
+            (to_like_pattern(term),),
+        )
+    
+    # Stream matching rows off the cursor rather than materializing them all first
+    matches: Dict[str, List[int]] = {}
+    for filename, page_num in cursor:
+        matches.setdefault(filename, []).append(page_num)
+    return [{"file": filename, "pages": pages} for filename, pages in matches.items()]
+
 def search_corpus(term: str) -> List[Dict[str, any]]:
-    """Search the corpus with input validation"""
+    """Search the FTS5 index with input validation"""
     if not validate_search_term(term):
         return []
     
@@ -252,24 +543,17 @@ def search_corpus(term: str) -> List[Dict[str, any]]:
         logger.warning("Search index file not found")
         return []
     
-    try:
-        with open(INDEX_FILE, "r", encoding="utf-8") as f:
-            corpus = json.load(f)
-    except Exception as e:
-        logger.error(f"Error loading search corpus: {e}")
+    if SQLITE_TOO_OLD or not index_file_is_usable():
         return []
     
-    results = []
-    term = term.lower()
+    term = term.casefold().strip()
     logger.info(f"Searching for term: {term}")
     
-    for filename, pages in corpus.items():
-        matched_pages = []
-        for page_num, text in pages.items():
-            if term in text.lower():
-                matched_pages.append(page_num)
-        if matched_pages:
-            results.append({"file": filename, "pages": matched_pages})
+    try:
+        results = query_corpus(term, INDEX_FILE.stat().st_mtime)
+    except sqlite3.Error as e:
+        logger.error(f"Error querying search corpus: {e}")
+        return []
     
     logger.info(f"Found {len(results)} matching files")
     return results
@@ -288,6 +572,8 @@ def main():
     initialize_session_state()
 
     st.title("DOJ Court Archive")
+    if SQLITE_TOO_OLD:
+        st.error(SQLITE_VERSION_ERROR)
     st.caption("Mobile-Optimized / Parallel Ingestion / Search Index")
     st.markdown("---")
 
@@ -314,11 +600,15 @@ def main():
                 links = st.session_state.pdf_links
                 status.text(f"Downloading {len(links)} files...")
                 
+                manifest = load_download_manifest()
                 with ThreadPoolExecutor(max_workers=MAX_WORKERS_DOWNLOADS) as executor:
-                    futures = [executor.submit(download_pdf_headless, url) for url in links]
+                    futures = [
+                        executor.submit(download_pdf_headless, url, manifest) for url in links
+                    ]
                     for i, _ in enumerate(as_completed(futures)):
                         progress.progress((i + 1) / len(links))
                         status.text(f"Downloading {i+1}/{len(links)}")
+                save_download_manifest(manifest)
                 
                 build_search_corpus(progress, status)
                 st.balloons()
@@ -326,6 +616,11 @@ def main():
 
     with tab2:
         st.subheader("Search Data")
+        if not index_file_is_usable():
+            st.error(
+                f"{INDEX_FILE} is not an SQLite index. "
+                "Set INDEX_FILE to e.g. corpus.db and re-run ingest."
+            )
         
         # Search history
         if st.session_state.search_history: